@@ -1,11 +1,15 @@
 import pandas as pd
 from pathlib import Path
 import logging
-from typing import Dict
+from typing import Dict, List, Tuple
+
+# Parsed descriptions keyed by (description path, use_value_description), stored with the CSV names and mtimes they were read at
+_TABLES_DESCRIPTION_CACHE: Dict[Tuple[str, bool], Tuple[Tuple[Tuple[str, float], ...], Dict[str, Dict[str, Dict[str, str]]]]] = {}
 
 def load_tables_description(db_directory_path: str, use_value_description: bool) -> Dict[str, Dict[str, Dict[str, str]]]:
     """
     Loads table descriptions from CSV files in the database directory.
+    Parsed descriptions are cached and reused until one of the CSV files changes.
 
     Args:
         db_directory_path (str): The path to the database directory.
@@ -14,15 +18,37 @@ def load_tables_description(db_directory_path: str, use_value_description: bool)
     Returns:
         Dict[str, Dict[str, Dict[str, str]]]: A dictionary containing table descriptions.
     """
-    encoding_types = ['utf-8-sig', 'cp1252']
     description_path = Path(db_directory_path) / "database_description"
     
     if not description_path.exists():
         logging.warning(f"Description path does not exist: {description_path}")
         return {}
     
+    csv_files = sorted(description_path.glob("*.csv"))
+    file_stamps = tuple((csv_file.name, csv_file.stat().st_mtime) for csv_file in csv_files)
+    cache_key = (str(description_path), use_value_description)
+    cached = _TABLES_DESCRIPTION_CACHE.get(cache_key)
+    if cached is not None and cached[0] == file_stamps:
+        return cached[1]
+    
+    table_description = _read_tables_description(csv_files, use_value_description)
+    _TABLES_DESCRIPTION_CACHE[cache_key] = (file_stamps, table_description)
+    return table_description
+
+def _read_tables_description(csv_files: List[Path], use_value_description: bool) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """
+    Parses the table description CSV files.
+
+    Args:
+        csv_files (List[Path]): The description CSV files, one per table.
+        use_value_description (bool): Whether to include value descriptions.
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, str]]]: A dictionary containing table descriptions.
+    """
+    encoding_types = ['utf-8-sig', 'cp1252']
     table_description = {}
-    for csv_file in description_path.glob("*.csv"):
+    for csv_file in csv_files:
         table_name = csv_file.stem.lower().strip()
         table_description[table_name] = {}
         could_read = False
@@ -1,3 +1,4 @@
+import heapq
 import pickle
 from datasketch import MinHash, MinHashLSH
 from pathlib import Path
@@ -64,7 +65,7 @@ def query_lsh(lsh: MinHashLSH, minhashes: Dict[str, Tuple[MinHash, str, str, str
     query_minhash = _create_minhash(signature_size, keyword, n_gram)
     results = lsh.query(query_minhash)
     similarities = [(result, _jaccard_similarity(query_minhash, minhashes[result][0])) for result in results]
-    similarities = sorted(similarities, key=lambda x: x[1], reverse=True)[:top_n]
+    similarities = heapq.nlargest(top_n, similarities, key=lambda x: x[1])
 
     similar_values_trimmed: Dict[str, Dict[str, List[str]]] = {}
     for result, similarity in similarities:
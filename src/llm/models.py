@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from langchain_core.exceptions import OutputParserException
@@ -10,6 +11,8 @@ from threading_utils import ordered_concurrent_function_calls
 def get_llm_chain(engine_name: str, temperature: float = 0, base_uri: str = None) -> Any:
     """
     Returns the appropriate LLM chain based on the provided engine name and temperature.
+    Chains are cached per (engine_name, temperature, base_uri) so that the underlying
+    API clients and their keep-alive connections are reused across calls.
 
     Args:
         engine (str): The name of the engine.
@@ -24,10 +27,25 @@ def get_llm_chain(engine_name: str, temperature: float = 0, base_uri: str = None
     """
     if engine_name not in ENGINE_CONFIGS:
         raise ValueError(f"Engine {engine_name} not supported")
-    
+    return _build_llm_chain(engine_name, temperature, base_uri)
+
+@lru_cache(maxsize=None)
+def _build_llm_chain(engine_name: str, temperature: float, base_uri: str) -> Any:
+    """
+    Constructs the LLM chain for the given engine configuration.
+
+    Args:
+        engine_name (str): The name of the engine.
+        temperature (float): The temperature for the LLM.
+        base_uri (str): The base URI for the engine, or None.
+
+    Returns:
+        Any: The LLM chain instance.
+    """
     config = ENGINE_CONFIGS[engine_name]
     constructor = config["constructor"]
-    params = config["params"]
+    # Copy so that per-call overrides do not leak into the shared engine configs
+    params = dict(config["params"])
     if temperature:
         params["temperature"] = temperature
     
@@ -1,5 +1,6 @@
 import os
 import logging
+from functools import lru_cache
 from typing import Any
 import re
 
@@ -11,9 +12,10 @@ from langchain.prompts import (
 
 TEMPLATES_ROOT_PATH = "templates"
 
+@lru_cache(maxsize=None)
 def _load_template(template_name: str) -> str:
     """
-    Loads a template from a file.
+    Loads a template from a file. Templates are read from disk once and cached.
 
     Args:
         template_name (str): The name of the template to load.
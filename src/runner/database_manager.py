@@ -6,7 +6,6 @@ from pathlib import Path
 from dotenv import load_dotenv
 from langchain_chroma import Chroma
 from typing import Callable, Dict, List, Any
-import time
 
 from database_utils.schema import DatabaseSchema
 from database_utils.schema_generator import DatabaseSchemaGenerator
@@ -68,19 +67,23 @@ class DatabaseManager:
 
     def set_lsh(self) -> str:
         """Sets the LSH and minhashes attributes by loading from pickle files."""
+        # Once loaded, the LSH never changes for this db_id, so skip the lock on the hot path.
+        # self.lsh is always assigned after self.minhashes, so a set self.lsh implies both are ready.
+        if self.lsh is not None:
+            return "error" if self.lsh == "error" else "success"
         with self._lock:
             if self.lsh is None:
                 try:
-                    start_time = time.time()
                     with (self.db_directory_path / "preprocessed" / f"{self.db_id}_lsh.pkl").open("rb") as file:
-                        self.lsh = pickle.load(file)
-                    after_lsh_time = time.time()
+                        lsh = pickle.load(file)
                     with (self.db_directory_path / "preprocessed" / f"{self.db_id}_minhashes.pkl").open("rb") as file:
-                        self.minhashes = pickle.load(file)
+                        minhashes = pickle.load(file)
+                    self.minhashes = minhashes
+                    self.lsh = lsh
                     return "success"
                 except Exception as e:
-                    self.lsh = "error"
                     self.minhashes = "error"
+                    self.lsh = "error"
                     print(f"Error loading LSH for {self.db_id}: {e}")
                     return "error"
             elif self.lsh == "error":
@@ -25,14 +25,16 @@ class Logger:
         Raises:
             ValueError: If the Logger instance has not been initialized.
         """
-        with cls._lock:
-            if (db_id is not None) and (question_id is not None):
-                cls._instance = super(Logger, cls).__new__(cls)
-                cls._instance._init(db_id, question_id, result_directory)
-            else:
-                if cls._instance is None:
-                    raise ValueError("Logger instance has not been initialized.")
-            return cls._instance
+        if (db_id is not None) and (question_id is not None):
+            with cls._lock:
+                # Publish the instance only after _init so unlocked fetches never see a partial logger
+                instance = super(Logger, cls).__new__(cls)
+                instance._init(db_id, question_id, result_directory)
+                cls._instance = instance
+        else:
+            if cls._instance is None:
+                raise ValueError("Logger instance has not been initialized.")
+        return cls._instance
 
     def _init(self, db_id: str, question_id: str, result_directory: str):
         """
@@ -54,11 +54,20 @@ class RunManager:
         return str(run_folder_path)
     
     def update_final_predictions(self, question_id: int, final_sql: str = None, db_id: int = None):
-        results = {}
         if final_sql:
             temp_results = {str(question_id): final_sql.strip() + "\t----- bird -----\t" + db_id}
         else:
             temp_results = {str(question_id): 0}
+        self._merge_final_predictions(temp_results)
+
+    def _merge_final_predictions(self, temp_results: Dict[str, Any]):
+        """
+        Merges the given predictions into the final predictions file under an exclusive lock.
+        
+        Args:
+            temp_results (Dict[str, Any]): The predictions keyed by question ID.
+        """
+        results = {}
         file_path = os.path.join(self.result_directory, "-predictions.json")
         with open(file_path, 'r+') as f:
             fcntl.flock(f, fcntl.LOCK_EX)
@@ -78,12 +87,15 @@ class RunManager:
         Args:
             dataset (List[Dict[str, Any]]): The dataset containing task information.
         """
+        placeholder_predictions = {}
         for i, data in enumerate(dataset):
             if "question_id" not in data:
                 data = {"question_id": i, **data}
-            self.update_final_predictions(data["question_id"])
+            placeholder_predictions[str(data["question_id"])] = 0
             task = Task(**data)
             self.tasks.append(task)
+        # Write all placeholders at once rather than rewriting the whole file per task
+        self._merge_final_predictions(placeholder_predictions)
         self.total_number_of_tasks = len(self.tasks)
         print(f"Total number of tasks: {self.total_number_of_tasks}")
 
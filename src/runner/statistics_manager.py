@@ -1,10 +1,12 @@
 import json
+import bisect
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Union, Tuple
 
 @dataclass
 class Statistics:
+    # The id lists are kept sorted on insertion so that dumping does not re-sort them
     corrects: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
     incorrects: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
     errors: Dict[str, List[Union[Tuple[str, str], Tuple[str, str, str]]]] = field(default_factory=dict)
@@ -29,9 +31,9 @@ class Statistics:
             },
             "ids": {
                 key: {
-                    "correct": sorted(self.corrects.get(key, [])),
-                    "incorrect": sorted(self.incorrects.get(key, [])),
-                    "error": sorted(self.errors.get(key, []))
+                    "correct": self.corrects.get(key, []),
+                    "incorrect": self.incorrects.get(key, []),
+                    "error": self.errors.get(key, [])
                 }
                 for key in self.total
             }
@@ -72,16 +74,16 @@ class StatisticsManager:
         if exec_res == 1:
             if validation_for not in self.statistics.corrects:
                 self.statistics.corrects[validation_for] = []
-            self.statistics.corrects[validation_for].append((db_id, question_id))
+            bisect.insort(self.statistics.corrects[validation_for], (db_id, question_id))
         else:
             if exec_err == "incorrect answer":
                 if validation_for not in self.statistics.incorrects:
                     self.statistics.incorrects[validation_for] = []
-                self.statistics.incorrects[validation_for].append((db_id, question_id))
+                bisect.insort(self.statistics.incorrects[validation_for], (db_id, question_id))
             else:
                 if validation_for not in self.statistics.errors:
                     self.statistics.errors[validation_for] = []
-                self.statistics.errors[validation_for].append((db_id, question_id, exec_err))
+                bisect.insort(self.statistics.errors[validation_for], (db_id, question_id, exec_err))
 
     def dump_statistics_to_file(self):
         """
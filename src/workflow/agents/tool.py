@@ -12,8 +12,9 @@ class Tool(ABC):
         self.tool_name = camel_to_snake(self.__class__.__name__)
     
     def __call__(self, state: SystemState) -> SystemState:
-        Logger().log(f"---START: {self.tool_name}---")
-        start_time = time.time()
+        logger = Logger()
+        logger.log(f"---START: {self.tool_name}---")
+        start_time = time.perf_counter()
         state.executing_tool = self.tool_name
         try:
             self._run(state)
@@ -21,16 +22,16 @@ class Tool(ABC):
                 "status": "success",
             }
         except Exception as e:
-            Logger().log(f"Tool '{self.tool_name}'\n{type(e)}: {e}\n", "error", state.task)
+            logger.log(f"Tool '{self.tool_name}'\n{type(e)}: {e}\n", "error", state.task)
             state.errors[self.tool_name] = f"{type(e)}: <{e}>"
             run_status = {
                 "status": "error",
                 "error": f"{type(e)}: <{e}>",
             }
-        run_status["execution_time"] = round(time.time() - start_time, 1)
+        run_status["execution_time"] = round(time.perf_counter() - start_time, 1)
         
         self._log_run(state, run_status)
-        Logger().log(f"---END: {self.tool_name} in {run_status['execution_time']}---")
+        logger.log(f"---END: {self.tool_name} in {run_status['execution_time']}---")
         return state
     
     @abstractmethod